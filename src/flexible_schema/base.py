@@ -1,8 +1,10 @@
 """A Meta-class for defining Schemas that can be created like dataclasses and used to validate tables."""
 
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import MISSING as _MISSING
 from dataclasses import dataclass, fields
-from typing import Any, ClassVar, Generic, TypeVar
+from typing import Any, ClassVar, Generic, NamedTuple, TypeVar
 
 from .columns import Column, ColumnDType, Nullability, resolve_dataclass_field
 from .exceptions import SchemaValidationError, TableValidationError
@@ -12,59 +14,191 @@ RawSchema_T = TypeVar("RawSchema_T")
 RawTable_T = TypeVar("RawTable_T")
 
 
+def _build_init(cls: type, cols: list[Column], old_init: Callable) -> Callable:
+    """Generates a specialized `__init__` for a schema class that wraps the dataclass `__init__`.
+
+    The generated function binds declared columns directly as (positional-only) parameters, fills in defaults
+    for omitted optional columns, and routes any remaining keyword arguments through the extra-column logic,
+    so that constructing an instance doesn't need to remap `*args` and `**kwargs` through intermediate dicts.
+
+    Args:
+        cls: The schema class the `__init__` is being built for.
+        cols: The resolved columns of the schema, in dataclass field order.
+        old_init: The dataclass-generated `__init__` to which declared columns are forwarded.
+
+    Returns:
+        The new `__init__` function.
+
+    Examples:
+        >>> class Sample:
+        ...     allow_extra_columns = False
+        ...     def __init__(self, a, b):
+        ...         self.a, self.b = a, b
+        >>> cols = [
+        ...     Column(int, name="a", is_optional=False),
+        ...     Column(str, name="b", is_optional=True, default="B"),
+        ... ]
+        >>> Sample.__init__ = _build_init(Sample, cols, Sample.__init__)
+        >>> s = Sample(1)
+        >>> s.a, s.b
+        (1, 'B')
+        >>> s = Sample(b="foo", a=2)
+        >>> s.a, s.b
+        (2, 'foo')
+        >>> Sample(1, "foo", 3)
+        Traceback (most recent call last):
+            ...
+        TypeError: Sample expected 2 arguments, got 3
+        >>> Sample(1, a=2)
+        Traceback (most recent call last):
+            ...
+        TypeError: Sample got multiple values for argument 'a'
+        >>> Sample(b="foo")
+        Traceback (most recent call last):
+            ...
+        TypeError: Sample missing required arguments: 'a'
+        >>> Sample(1, c=3)
+        Traceback (most recent call last):
+            ...
+        flexible_schema.exceptions.SchemaValidationError: Sample does not allow extra columns, but got: 'c'
+    """
+
+    name = cls.__name__
+    n_cols = len(cols)
+    required = [c.name for c in cols if c.is_required]
+
+    def too_many_args(args: tuple):
+        raise TypeError(f"{name} expected {n_cols} arguments, got {n_cols + len(args)}")
+
+    def multiple_values(col: str):
+        raise TypeError(f"{name} got multiple values for argument '{col}'")
+
+    def missing_args(*vals: Any):
+        err_str = ", ".join(repr(c) for c, v in zip(required, vals, strict=True) if v is _MISSING)
+        raise TypeError(f"{name} missing required arguments: {err_str}")
+
+    def disallowed_extra(extra: dict[str, Any]):
+        err_str = ", ".join(repr(k) for k in extra)
+        raise SchemaValidationError(f"{name} does not allow extra columns, but got: {err_str}")
+
+    # All generated names are prefixed to avoid collisions with column names, which are used as parameters.
+    params = "".join(f"{c.name}=__schema_missing__, " for c in cols)
+    lines = [
+        f"def __init__(__schema_self__, {params}/, *__schema_args__, **__schema_kwargs__):",
+        "    if __schema_args__:",
+        "        __schema_too_many_args__(__schema_args__)",
+        "    if __schema_kwargs__:",
+    ]
+    for c in cols:
+        lines.extend(
+            [
+                f"        if {c.name!r} in __schema_kwargs__:",
+                f"            if {c.name} is not __schema_missing__:",
+                f"                __schema_multiple_values__({c.name!r})",
+                f"            {c.name} = __schema_kwargs__.pop({c.name!r})",
+            ]
+        )
+    lines.extend(
+        [
+            "        if __schema_kwargs__ and not __schema_cls__.allow_extra_columns:",
+            "            __schema_disallowed_extra__(__schema_kwargs__)",
+        ]
+    )
+    if required:
+        lines.extend(
+            [
+                f"    if {' or '.join(f'{n} is __schema_missing__' for n in required)}:",
+                f"        __schema_missing_args__({', '.join(required)})",
+            ]
+        )
+    for i, c in enumerate(cols):
+        if c.is_optional:
+            lines.extend(
+                [
+                    f"    if {c.name} is __schema_missing__:",
+                    f"        {c.name} = __schema_cols__[{i}].default",
+                ]
+            )
+    lines.extend(
+        [
+            f"    __schema_old_init__(__schema_self__{''.join(f', {c.name}={c.name}' for c in cols)})",
+            "    for __schema_k__, __schema_v__ in __schema_kwargs__.items():",
+            "        __schema_self__[__schema_k__] = __schema_v__",
+        ]
+    )
+
+    exec_globals = {
+        "__schema_missing__": _MISSING,
+        "__schema_cls__": cls,
+        "__schema_cols__": cols,
+        "__schema_old_init__": old_init,
+        "__schema_too_many_args__": too_many_args,
+        "__schema_multiple_values__": multiple_values,
+        "__schema_missing_args__": missing_args,
+        "__schema_disallowed_extra__": disallowed_extra,
+    }
+    ns = {}
+    exec("\n".join(lines), exec_globals, ns)
+
+    new_init = ns["__init__"]
+    new_init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return new_init
+
+
 class SchemaMeta(ABCMeta):
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
+
+        if not any(isinstance(base, SchemaMeta) for base in bases):
+            # The root, abstract `Schema` class declares no columns and is never instantiated, so we don't
+            # need to build a dataclass or specialized `__init__` for it.
+            return cls
+
         cls = dataclass(cls)  # explicitly turn cls into a dataclass here
         # Add constants after dataclass is fully initialized
 
-        cols = [resolve_dataclass_field(f, type_mapper=cls.map_type) for f in fields(cls)]
+        cls_fields = fields(cls)
+        cols = [resolve_dataclass_field(f, type_mapper=cls.map_type) for f in cls_fields]
 
-        for f, c in zip(fields(cls), cols, strict=False):
+        for f, c in zip(cls_fields, cols, strict=False):
             f.metadata = {**f.metadata, "column": c}
 
+        dtypes = {}
         for c in cols:
             # Set attribute shortcuts
             setattr(cls, f"{c.name}_name", c.name)
             setattr(cls, f"{c.name}_dtype", c.dtype)
+            dtypes[c.name] = c.dtype
 
-        field_names = [c.name for c in cols]
-
-        old_init = cls.__init__
-
-        def new_init(self, *args, **kwargs):
-            if len(args) > len(field_names):
-                raise TypeError(f"{cls.__name__} expected {len(field_names)} arguments, got {len(args)}")
+        cls.__col_dtypes__ = dtypes
 
-            out_kwargs = {}
-            for i, arg in enumerate(args):
-                out_kwargs[field_names[i]] = arg
+        # Cache the resolved columns and their groupings so validation doesn't need to re-walk the dataclass
+        # fields or re-evaluate column properties.
+        cls.__columns__ = tuple(cols)
+        cls.__columns_map__ = {c.name: c for c in cols}
+        cls.__is_optional__ = {c.name: bool(c.is_optional) for c in cols}
+        cls.__required_names__ = tuple(c.name for c in cols if c.is_required)
+        cls.__optional_names__ = tuple(c.name for c in cols if c.is_optional)
+        cls.__all_names__ = cls.__required_names__ + cls.__optional_names__
+        cls.__all_names_set__ = frozenset(cls.__all_names__)
 
-            for k, v in kwargs.items():
-                if k in out_kwargs:
-                    raise TypeError(f"{cls.__name__} got multiple values for argument '{k}'")
-                out_kwargs[k] = v
+        cls.__init__ = _build_init(cls, cols, cls.__init__)
 
-            to_pass = {k: v for k, v in out_kwargs.items() if k in field_names}
-            extra = {k: v for k, v in out_kwargs.items() if k not in field_names}
-
-            if not (hasattr(cls, "allow_extra_columns") and cls.allow_extra_columns) and extra:
-                err_str = ", ".join(repr(k) for k in extra)
-                raise SchemaValidationError(
-                    f"{cls.__name__} does not allow extra columns, but got: {err_str}"
-                )
+        return cls
 
-            for c in cols:
-                if c.is_optional and c.name not in to_pass:
-                    to_pass[c.name] = c.default
 
-            old_init(self, **to_pass)
-            for k, v in extra.items():
-                self[k] = v
+class _AlignmentPlan(NamedTuple):
+    """The (table-independent) operations needed to align tables with a given raw schema to a schema.
 
-        cls.__init__ = new_init
+    Attributes:
+        raw_cols: The columns of the raw schema, in order.
+        col_order: The order the columns should be placed in after alignment.
+        mistyped_cols: The columns that need to be cast, as `(column, wanted type, actual type)` tuples.
+    """
 
-        return cls
+    raw_cols: list[str]
+    col_order: list[str]
+    mistyped_cols: list[tuple[str, ColumnDType, ColumnDType]]
 
 
 # We define this so that we can appropriately annotate the `from_dict` method in a way that will translate to
@@ -75,33 +209,48 @@ S = TypeVar("Schema", bound="Schema")
 class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMeta):
     allow_extra_columns: ClassVar[bool] = True
 
+    # Per-class column caches, populated by `SchemaMeta` for each subclass.
+    __columns__: ClassVar[tuple[Column, ...]] = ()
+    __columns_map__: ClassVar[dict[str, Column]] = {}
+    __col_dtypes__: ClassVar[dict[str, ColumnDType]] = {}
+    __is_optional__: ClassVar[dict[str, bool]] = {}
+    __required_names__: ClassVar[tuple[str, ...]] = ()
+    __optional_names__: ClassVar[tuple[str, ...]] = ()
+    __all_names__: ClassVar[tuple[str, ...]] = ()
+    __all_names_set__: ClassVar[frozenset[str]] = frozenset()
+
     # The Schema class should behave like a dictionary:
 
     def __getitem__(self, key: str):
         return getattr(self, key)
 
     def __setitem__(self, key: str, value: Any):
-        if hasattr(self, key) or self.allow_extra_columns:
+        cls = type(self)
+        if key in cls.__all_names_set__ or cls.allow_extra_columns:
             setattr(self, key, value)
         else:
             raise SchemaValidationError(f"Extra field not allowed: {key!r}")
 
+    def _iter_present(self):
+        """Iterate over the `(key, value)` pairs of this object whose values are not `None`."""
+        return ((k, v) for k, v in self.__dict__.items() if v is not None)
+
     def keys(self):
-        return self.to_dict().keys()
+        return [k for k, _ in self._iter_present()]
 
     def values(self):
-        return self.to_dict().values()
+        return [v for _, v in self._iter_present()]
 
     def items(self):
-        return self.to_dict().items()
+        return list(self._iter_present())
 
     def __iter__(self):
-        return iter(self.keys())
+        return (k for k, _ in self._iter_present())
 
     # The Schema class should be convertible to and from a dictionary:
 
     def to_dict(self):
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return dict(self._iter_present())
 
     @classmethod
     def from_dict(cls: type[S], data: dict) -> S:
@@ -111,31 +260,31 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
 
     @classmethod
     def _columns(cls: type[S]) -> list[Column]:
-        return [f.metadata["column"] for f in fields(cls)]
+        return list(cls.__columns__)
 
     @classmethod
     def _columns_map(cls: type[S]) -> dict[str, Column]:
-        return {c.name: c for c in cls._columns()}
+        return dict(cls.__columns_map__)
 
     @classmethod
-    def optional_columns(cls: type[S]) -> list[str]:
-        """Return a list of optional columns."""
-        return [c.name for c in cls._columns() if c.is_optional]
+    def optional_columns(cls: type[S]) -> tuple[str, ...]:
+        """Return a tuple of optional columns."""
+        return cls.__optional_names__
 
     @classmethod
-    def required_columns(cls: type[S]) -> list[str]:
-        """Return a list of required columns."""
-        return [c.name for c in cls._columns() if c.is_required]
+    def required_columns(cls: type[S]) -> tuple[str, ...]:
+        """Return a tuple of required columns."""
+        return cls.__required_names__
 
     @classmethod
-    def columns(cls: type[S]) -> list[str]:
-        """Return a list of all columns, starting with required columns."""
-        return cls.required_columns() + cls.optional_columns()
+    def columns(cls: type[S]) -> tuple[str, ...]:
+        """Return a tuple of all columns, starting with required columns."""
+        return cls.__all_names__
 
     @classmethod
     def column_type(cls: type[S], col: str) -> ColumnDType:
         """Return the type of a column."""
-        return cls._columns_map()[col].dtype
+        return cls.__col_dtypes__[col]
 
     @classmethod
     @abstractmethod
@@ -164,41 +313,86 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
         raise NotImplementedError(f"__raw_schema_cols is not supported by {cls.__name__} objects.")
 
     @classmethod
-    def _disallowed_extra_cols(cls: type[S], schema: RawSchema_T) -> list[str]:
-        """Get a list of extra columns that are not allowed in the schema."""
+    def _disallowed_extra_cols(cls: type[S], raw_cols: list[str]) -> list[str]:
+        """Get a list of extra columns that are not allowed in the schema.
+
+        Args:
+            raw_cols: The columns of the raw schema, in order.
+        """
         if cls.allow_extra_columns:
             return []
-        return [col for col in cls._raw_schema_cols(schema) if col not in set(cls.columns())]
+        all_names = cls.__all_names_set__
+        return [col for col in raw_cols if col not in all_names]
 
     @classmethod
-    def _missing_req_cols(cls: type[S], schema: RawSchema_T) -> list[str]:
-        """Get a list of required columns that are missing in the schema."""
-        return [col for col in cls.required_columns() if col not in set(cls._raw_schema_cols(schema))]
+    def _missing_req_cols(cls: type[S], raw_cols: set[str]) -> list[str]:
+        """Get a list of required columns that are missing in the schema.
+
+        Args:
+            raw_cols: The set of columns in the raw schema.
+        """
+        return [col for col in cls.__required_names__ if col not in raw_cols]
 
     @classmethod
-    def _mistyped_cols(cls: type[S], schema: RawSchema_T) -> list[tuple[str, ColumnDType, ColumnDType]]:
-        """Get a list of columns that have incorrect types in the schema."""
-        raw_cols = set(cls._raw_schema_cols(schema))
-        return [
-            (col, cls.column_type(col), cls._raw_schema_col_type(schema, col))
-            for col in cls.columns()
-            if col in raw_cols and cls.column_type(col) != cls._raw_schema_col_type(schema, col)
-        ]
+    def _mistyped_cols(
+        cls: type[S], schema: RawSchema_T, raw_cols: set[str]
+    ) -> list[tuple[str, ColumnDType, ColumnDType]]:
+        """Get a list of columns that have incorrect types in the schema.
+
+        Args:
+            schema: The raw schema to check.
+            raw_cols: The set of columns in the raw schema.
+        """
+        own_types = cls.__col_dtypes__
+        raw_type = cls._raw_schema_col_type
+
+        mistyped = []
+        for col in cls.__all_names__:
+            if col not in raw_cols:
+                continue
+            want, got = own_types[col], raw_type(schema, col)
+            if want != got:
+                mistyped.append((col, want, got))
+        return mistyped
+
+    @classmethod
+    def _schema_report(
+        cls: type[S], schema: RawSchema_T, raw_cols: list[str] | None = None
+    ) -> tuple[list[str], list[str], list[tuple[str, ColumnDType, ColumnDType]]]:
+        """Report how the schema deviates from the class schema, without raising any errors.
+
+        Args:
+            schema: The schema to check.
+            raw_cols: The columns of `schema`, if they have already been extracted by the caller.
+
+        Returns:
+            A tuple of the disallowed extra columns, the missing required columns, and the mistyped columns
+            (as `(column, wanted type, actual type)` tuples). All are empty if the schema is valid.
+        """
+
+        if raw_cols is None:
+            raw_cols = cls._raw_schema_cols(schema)
+        raw_cols_set = set(raw_cols)
+
+        return (
+            cls._disallowed_extra_cols(raw_cols),
+            cls._missing_req_cols(raw_cols_set),
+            cls._mistyped_cols(schema, raw_cols_set),
+        )
 
     @classmethod
-    def _validate_schema(cls: type[S], schema: RawSchema_T):
+    def _validate_schema(cls: type[S], schema: RawSchema_T, raw_cols: list[str] | None = None):
         """Validate the schema against the class schema and raise an error if invalid.
 
         Args:
             schema: The schema to validate.
+            raw_cols: The columns of `schema`, if they have already been extracted by the caller.
 
         Raises:
             SchemaValidationError: If the schema is invalid.
         """
 
-        disallowed_extra_cols = cls._disallowed_extra_cols(schema)
-        missing_req_cols = cls._missing_req_cols(schema)
-        mistyped_cols = cls._mistyped_cols(schema)
+        disallowed_extra_cols, missing_req_cols, mistyped_cols = cls._schema_report(schema, raw_cols)
 
         if disallowed_extra_cols or missing_req_cols or mistyped_cols:
             raise SchemaValidationError(
@@ -228,15 +422,31 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
     @classmethod
     def _validate_table(cls: type[S], table: RawTable_T):
         """Validate the table against the schema."""
-        cls._validate_schema(cls._raw_table_schema(table))
+        raw_schema = cls._raw_table_schema(table)
+        raw_cols = cls._raw_schema_cols(raw_schema)
+
+        cls._validate_schema(raw_schema, raw_cols=raw_cols)
+        cls._validate_nullability(table, raw_cols)
 
+    @classmethod
+    def _validate_nullability(cls: type[S], table: RawTable_T, raw_cols: list[str]):
+        """Validate the nullability constraints of the columns present in the table.
+
+        Args:
+            table: The table to validate.
+            raw_cols: The columns of `table`.
+
+        Raises:
+            TableValidationError: If any column violates its nullability constraint.
+        """
+        raw_cols_set = set(raw_cols)
         nullability_none_err_cols = []
         nullability_some_err_cols = []
-        for col in cls.columns():
-            if col not in cls._raw_table_cols(table):
+        for col in cls.__all_names__:
+            if col not in raw_cols_set:
                 continue
 
-            match cls._columns_map()[col].nullable:
+            match cls.__columns_map__[col].nullable:
                 case Nullability.NONE if cls._any_null(table, col):
                     nullability_none_err_cols.append(col)
                 case Nullability.SOME if cls._all_null(table, col):
@@ -250,6 +460,15 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
                 nullability_some_err_cols=nullability_some_err_cols,
             )
 
+    @classmethod
+    def _raw_schema_type(cls) -> type:
+        """Get the type of this class's raw schema, computing it from `cls.schema()` only on first use."""
+        raw_schema_type = cls.__dict__.get("__raw_schema_type__")
+        if raw_schema_type is None:
+            raw_schema_type = type(cls.schema())
+            cls.__raw_schema_type__ = raw_schema_type
+        return raw_schema_type
+
     @classmethod
     def _is_raw_schema(cls, arg: Any) -> bool:
         """Check if the argument is a raw schema (e.g., of type `RawSchema_T`).
@@ -263,7 +482,7 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
             True if the argument is a schema, False otherwise.
         """
 
-        return isinstance(arg, type(cls.schema()))
+        return isinstance(arg, cls._raw_schema_type())
 
     @classmethod
     @abstractmethod
@@ -323,17 +542,31 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
     @classmethod
     def _align_col_order(cls: type[S], table: RawTable_T) -> RawTable_T:
         """Re-order the columns of the table to match the schema."""
-        table_cols = cls._raw_table_cols(table)
+        return cls._reorder_raw_table(table, cls._aligned_col_order(cls._raw_table_cols(table)))
+
+    @classmethod
+    def _aligned_col_order(cls: type[S], table_cols: list[str]) -> list[str]:
+        """Get the order of output columns for a table with the given columns when aligned to the schema.
+
+        Args:
+            table_cols: The columns of the table, in their current order.
 
-        out_order = []
-        for c in cls._columns():
-            if c.is_required or c.name in table_cols:
-                out_order.append(c.name)
+        Returns:
+            The schema's required columns and any optional columns present in the table, in schema order,
+            followed by any extra columns in their current order (if extra columns are allowed).
+        """
+        table_cols_set = set(table_cols)
+        out_order = [
+            col
+            for col, is_optional in cls.__is_optional__.items()
+            if not is_optional or col in table_cols_set
+        ]
 
         if cls.allow_extra_columns:
-            out_order.extend([c for c in table_cols if c not in out_order])
+            out_order_set = set(out_order)
+            out_order.extend(c for c in table_cols if c not in out_order_set)
 
-        return cls._reorder_raw_table(table, out_order)
+        return out_order
 
     @classmethod
     @abstractmethod
@@ -346,7 +579,11 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
     def _cast_raw_table(
         cls: type[S], table: RawTable_T, mistyped_cols: list[tuple[str, ColumnDType, ColumnDType]]
     ) -> RawTable_T:
-        """Cast the columns of the table to match the schema."""
+        """Cast the columns of the table to match the schema.
+
+        By default, this casts each column in turn via `_cast_raw_table_column`. Subclasses whose backends can
+        cast several columns in a single operation should override this with a batched implementation.
+        """
 
         for col, want_type, _ in mistyped_cols:
             table = cls._cast_raw_table_column(table, col, want_type)
@@ -358,9 +595,13 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
         """Align the table to the schema.
 
         > [!WARNING]
-        > This method will only work if the implementation of the validation functions in the derived classes
-        > return detailed errors indicating the source of validation errors during schema and table
-        > validation.
+        > This method relies on the derived class's `_raw_schema_cols` and `_raw_schema_col_type` accurately
+        > reporting the columns and types of the raw schema, as these determine which columns are missing,
+        > extra, or need to be cast. Nullability is checked on the table as given, before any cast is applied.
+
+        Alignment goes through `align_batch`/`iter_align`, which check the raw schema, nullability, column
+        order and types directly; `validate`, `_validate_table` and `_align_col_order` are not called, so
+        overriding them in a subclass does not change how tables are aligned.
 
         Args:
             table: The table to align.
@@ -373,29 +614,107 @@ class Schema(Generic[RawDataType_T, RawSchema_T, RawTable_T], metaclass=SchemaMe
             TableValidationError: If the table is invalid to the degree that alignment is impossible.
         """
 
-        mistyped_cols = []
-
-        try:
-            cls.validate(table)
-        except SchemaValidationError as e:
-            if e.missing_req_cols or e.disallowed_extra_cols:
-                raise SchemaValidationError(
-                    disallowed_extra_cols=e.disallowed_extra_cols,
-                    missing_req_cols=e.missing_req_cols,
-                ) from e
-            elif e.mistyped_cols:
-                mistyped_cols = e.mistyped_cols
-            else:
-                raise e
-        except:
-            raise
+        return cls.align_batch([table])[0]
+
+    @classmethod
+    def _alignment_plan(cls: type[S], raw_schema: RawSchema_T) -> _AlignmentPlan:
+        """Determine how tables with the given raw schema are aligned to this schema.
+
+        Args:
+            raw_schema: The raw schema of the table(s) to align.
+
+        Returns:
+            The plan for aligning tables with this raw schema.
+
+        Raises:
+            SchemaValidationError: If the raw schema has missing required or disallowed extra columns, such
+                that alignment is impossible.
+        """
+
+        raw_cols = cls._raw_schema_cols(raw_schema)
+
+        # Mistyped columns aren't errors here, as we'll try to cast them, so rather than validating the schema
+        # and inspecting the raised error we use the schema report directly.
+        disallowed_extra_cols, missing_req_cols, mistyped_cols = cls._schema_report(raw_schema, raw_cols)
+        if disallowed_extra_cols or missing_req_cols:
+            raise SchemaValidationError(
+                disallowed_extra_cols=disallowed_extra_cols,
+                missing_req_cols=missing_req_cols,
+            )
+
+        return _AlignmentPlan(raw_cols, cls._aligned_col_order(raw_cols), mistyped_cols)
+
+    @classmethod
+    def iter_align(cls: type[S], tables: Iterable[RawTable_T]) -> Iterator[RawTable_T]:
+        """Lazily align a stream of tables to the schema.
+
+        This behaves like calling `align` on each table, except that the schema validation, column order, and
+        casts needed for alignment are only re-computed when a table's schema differs from the schema of the
+        previous table. Nullability constraints are still validated for every table. Tables whose columns are
+        already in the aligned order are not re-ordered, and tables that need no casts are not cast, so a
+        table that is already aligned is returned as-is.
+
+        Tables are consumed and aligned one at a time, so this can be used over (e.g.) a stream of batches
+        read from disk without holding all of them in memory.
+
+        Args:
+            tables: The tables to align.
+
+        Yields:
+            The aligned tables, in order.
 
-        table = cls._align_col_order(table)
+        Raises:
+            SchemaValidationError: If any table's schema is invalid such that alignment is impossible.
+            TableValidationError: If any table is invalid such that alignment is impossible.
+            TypeError: If any element of `tables` is not a table.
+        """
+
+        prev_raw_schema, plan = None, None
+        for table in tables:
+            if not cls._is_raw_table(table):
+                raise TypeError(f"Expected a table, but got: {type(table).__name__}")
 
-        if mistyped_cols:
             try:
-                table = cls._cast_raw_table(table, mistyped_cols)
+                raw_schema = cls._raw_table_schema(table)
+                if plan is None or raw_schema != prev_raw_schema:
+                    plan = cls._alignment_plan(raw_schema)
+                    prev_raw_schema = raw_schema
+
+                cls._validate_nullability(table, plan.raw_cols)
+            except (SchemaValidationError, TableValidationError):
+                raise
             except Exception as e:
-                raise SchemaValidationError(mistyped_cols=mistyped_cols) from e
+                raise TableValidationError("Table validation failed") from e
 
-        return table
+            # Tables that are already in schema order (e.g., the output of a prior alignment) needn't be
+            # re-ordered.
+            if plan.col_order != plan.raw_cols:
+                table = cls._reorder_raw_table(table, plan.col_order)
+
+            if plan.mistyped_cols:
+                try:
+                    table = cls._cast_raw_table(table, plan.mistyped_cols)
+                except Exception as e:
+                    raise SchemaValidationError(mistyped_cols=plan.mistyped_cols) from e
+
+            yield table
+
+    @classmethod
+    def align_batch(cls: type[S], tables: Iterable[RawTable_T]) -> list[RawTable_T]:
+        """Align a sequence of tables to the schema.
+
+        This is the eager version of `iter_align`; see there for details.
+
+        Args:
+            tables: The tables to align.
+
+        Returns:
+            The aligned tables, in order.
+
+        Raises:
+            SchemaValidationError: If any table's schema is invalid such that alignment is impossible.
+            TableValidationError: If any table is invalid such that alignment is impossible.
+            TypeError: If any element of `tables` is not a table.
+        """
+
+        return list(cls.iter_align(tables))
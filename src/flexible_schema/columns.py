@@ -2,14 +2,16 @@ import copy
 import types
 from collections.abc import Callable
 from dataclasses import MISSING, Field
+from datetime import date, time, timedelta
 from enum import Enum
 from typing import Any, Union, get_args, get_origin
 
 
-class Nullability(Enum):
+class Nullability(str, Enum):
     """A simple str-like enum to represent the nullability of a column.
 
-    Upon Python upgrade to 3.11, convert to `StrEnum`.
+    Members are strings, so comparisons against the string values use plain string equality. Upon Python
+    upgrade to 3.11, convert to `StrEnum`.
 
     Attributes:
         NONE: No value in the given column can be `null`/`None`.
@@ -27,21 +29,112 @@ class Nullability(Enum):
         True
         >>> Nullability.SOME == Nullability.ALL
         False
+        >>> {Nullability.SOME: 1}["some"]
+        1
     """
 
     NONE = "none"
     SOME = "some"
     ALL = "all"
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.value == other
-        else:
-            return super().__eq__(other)
+    __hash__ = str.__hash__
+
 
+_STR_TO_NULLABILITY = {n.value: n for n in Nullability}
 
 ColumnDType = type | Any
 
+# Default values of these types can't be mutated, so they can be stored without a (deep) copy.
+_IMMUTABLE_DEFAULT_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+    type,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    Enum,
+    date,
+    time,
+    timedelta,
+)
+# Exact types checked with a single set lookup before the (slower) `isinstance` check above.
+_SCALAR_DEFAULT_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+
+def _is_immutable(value: Any) -> bool:
+    """Checks whether a value (e.g., a column default) is immutable, such that it needn't be copied.
+
+    Examples:
+        >>> _is_immutable(3)
+        True
+        >>> _is_immutable("foo")
+        True
+        >>> _is_immutable(Nullability.ALL)
+        True
+        >>> _is_immutable(("a", 1, frozenset({2})))
+        True
+        >>> _is_immutable(("a", [1]))
+        False
+        >>> _is_immutable(["foo"])
+        False
+        >>> _is_immutable({"a": 1})
+        False
+    """
+    if type(value) in _SCALAR_DEFAULT_TYPES or isinstance(value, _IMMUTABLE_DEFAULT_TYPES):
+        return True
+    if isinstance(value, tuple | frozenset):
+        return all(_is_immutable(v) for v in value)
+    return False
+
+
+def _copy_default(value: Any) -> Any:
+    """Copies a column default so the stored value can't be mutated through the caller's reference.
+
+    Immutable values are returned as-is, and plain lists, dicts, and sets of immutable values only need a
+    shallow copy; anything else falls back to `copy.deepcopy`.
+
+    Examples:
+        >>> v = "foo"
+        >>> _copy_default(v) is v
+        True
+        >>> v = ["a", "b"]
+        >>> out = _copy_default(v)
+        >>> out == v, out is v
+        (True, False)
+        >>> v = {"a": 1}
+        >>> out = _copy_default(v)
+        >>> out == v, out is v
+        (True, False)
+
+    Nested mutable values are still copied deeply:
+
+        >>> v = {"a": [1, 2]}
+        >>> out = _copy_default(v)
+        >>> out == v, out["a"] is v["a"]
+        (True, False)
+    """
+    if _is_immutable(value):
+        return value
+
+    value_type = type(value)
+    if (value_type is list or value_type is set) and all(map(_is_immutable, value)):
+        return value.copy()
+    if value_type is dict and all(map(_is_immutable, value)) and all(map(_is_immutable, value.values())):
+        return value.copy()
+
+    return copy.deepcopy(value)
+
+
+_NONE_TYPE = type(None)
+
+# Both `typing.Union[...]` / `typing.Optional[...]` and `X | Y` annotations can express nullable types.
+_UNION_ORIGINS = frozenset({Union, types.UnionType})
+
 
 class Column:
     """A simple class to represent a column in the schema.
@@ -99,6 +192,8 @@ class Column:
             string, it must be one of 'none', 'some', or 'all'.
     """
 
+    __slots__ = ("_default", "_is_optional", "_nullable", "dtype", "name")
+
     def __init__(
         self,
         dtype: ColumnDType,
@@ -113,6 +208,35 @@ class Column:
         self.default = default
         self.nullable = nullable
 
+    @classmethod
+    def _construct_unchecked(
+        cls,
+        dtype: ColumnDType,
+        default: ColumnDType | None = None,
+        nullable: Nullability | None = None,
+        name: str | None = None,
+        is_optional: bool | None = None,
+    ) -> "Column":
+        """Builds a column from already-validated inputs, skipping the property setters.
+
+        This is for internal use only; the caller is responsible for passing a `Nullability` (or `None`) for
+        `nullable` and for not passing a default to a required column. Defaults are stored as-is, without a
+        copy.
+
+        Examples:
+            >>> Column._construct_unchecked(int, nullable=Nullability.ALL, name="foo")
+            Column(int, name=foo, nullable=Nullability.ALL)
+            >>> Column._construct_unchecked(str, is_optional=True, default="foo")
+            Column(str, is_optional=True, default=foo)
+        """
+        col = cls.__new__(cls)
+        col.dtype = dtype
+        col.name = name
+        col._is_optional = is_optional
+        col._default = default
+        col._nullable = nullable
+        return col
+
     @property
     def default(self) -> ColumnDType | None:
         return self._default() if callable(self._default) else self._default
@@ -123,14 +247,14 @@ class Column:
             self._default = None
             return
 
-        if self.is_required:
+        if not self._is_optional:
             raise ValueError("Required columns cannot have a default value")
 
-        self._default = copy.deepcopy(value)
+        self._default = _copy_default(value)
 
     @property
     def is_required(self) -> bool:
-        return not self.is_optional
+        return not self._is_optional
 
     @property
     def is_optional(self) -> bool:
@@ -147,7 +271,7 @@ class Column:
     @property
     def nullable(self) -> Nullability:
         if self._nullable is None:
-            if self.is_optional:
+            if self._is_optional:
                 return Nullability.SOME if self.has_default else Nullability.ALL
             else:
                 return Nullability.SOME
@@ -155,25 +279,26 @@ class Column:
 
     @nullable.setter
     def nullable(self, value: bool | str | Nullability | None):
-        match value:
-            case bool():
-                if value:
-                    self._nullable = Nullability.ALL
-                else:
-                    self._nullable = Nullability.NONE
-            case str() if value in ("none", "some", "all"):
-                self._nullable = Nullability(value)
-            case Nullability() | None:
-                self._nullable = value
-            case _:
-                raise TypeError(
-                    f"Invalid type for nullable: {type(value)}, expected bool, str, or Nullability. "
-                    f"If using a string, it must be one of 'none', 'some', or 'all'."
-                )
+        if value is None or isinstance(value, Nullability):
+            self._nullable = value
+        elif value is True:
+            self._nullable = Nullability.ALL
+        elif value is False:
+            self._nullable = Nullability.NONE
+        elif isinstance(value, str) and value in _STR_TO_NULLABILITY:
+            self._nullable = _STR_TO_NULLABILITY[value]
+        else:
+            raise TypeError(
+                f"Invalid type for nullable: {type(value)}, expected bool, str, or Nullability. "
+                f"If using a string, it must be one of 'none', 'some', or 'all'."
+            )
 
     def __repr__(self) -> str:
         cls_str = self.__class__.__name__
-        t_str = self.dtype.__name__ if hasattr(self.dtype, "__name__") else repr(self.dtype)
+        try:
+            t_str = self.dtype.__name__
+        except AttributeError:
+            t_str = repr(self.dtype)
 
         if self.name:
             t_str = f"{t_str}, name={self.name}"
@@ -182,7 +307,7 @@ class Column:
         if self.has_default:
             t_str = f"{t_str}, default={self.default}"
         if self._nullable is not None:
-            t_str = f"{t_str}, nullable={self.nullable}"
+            t_str = f"{t_str}, nullable={self.nullable!s}"
 
         return f"{cls_str}({t_str})"
 
@@ -225,7 +350,9 @@ class Optional(Column):
         >>> O.default
         ['foo']
 
-    Default values are deep-copied to avoid mutable default arguments:
+    Mutable default values are copied to avoid mutable default arguments: flat lists, sets, and dicts of
+    immutable values are copied shallowly, anything with nested mutable values is deep-copied, and immutable
+    values are stored as-is:
 
         >>> default_list = ["foo"]
         >>> O = Optional(list[str], default=default_list)
@@ -249,6 +376,8 @@ class Optional(Column):
         ValueError: is_optional cannot be set to False for Optional columns
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         if "is_optional" not in kwargs:
             kwargs["is_optional"] = True
@@ -312,6 +441,8 @@ class Required(Column):
         ValueError: Required columns cannot have a default value
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         if "is_optional" not in kwargs:
             kwargs["is_optional"] = False
@@ -378,15 +509,21 @@ def _resolve_annotation(
 
         return annotation
 
-    origin = get_origin(annotation)
-    if (origin is Union or origin is types.UnionType) and type(None) in get_args(annotation):
-        base_type = next(a for a in get_args(annotation) if a is not type(None))
+    if isinstance(annotation, type):
+        # Plain classes (the common case) can't be unions, so skip the `typing` introspection entirely.
+        return Column._construct_unchecked(type_mapper(annotation))
+
+    args = get_args(annotation)
+    if get_origin(annotation) in _UNION_ORIGINS and _NONE_TYPE in args:
+        # Unions de-duplicate their members, so `None` appears at most once and the first non-`None` member is
+        # always one of the first two.
+        base_type = args[1] if args[0] is _NONE_TYPE else args[0]
         col = _resolve_annotation(base_type, type_mapper)
         col.nullable = True
 
         return col
 
-    return Column(type_mapper(annotation))
+    return Column._construct_unchecked(type_mapper(annotation))
 
 
 def resolve_dataclass_field(
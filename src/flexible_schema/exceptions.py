@@ -16,11 +16,11 @@ class SchemaValidationError(Exception):
         self.missing_req_cols = missing_req_cols
         self.mistyped_cols = mistyped_cols
         self.msg = msg
+        self.message = self._build_message()
 
         super().__init__(self.message)
 
-    @property
-    def message(self) -> str:
+    def _build_message(self) -> str:
         if self.msg is not None:
             return self.msg
 
@@ -49,11 +49,11 @@ class TableValidationError(Exception):
         self.nullability_none_err_cols = nullability_none_err_cols
         self.nullability_some_err_cols = nullability_some_err_cols
         self.msg = msg
+        self.message = self._build_message()
 
         super().__init__(self.message)
 
-    @property
-    def message(self) -> str:
+    def _build_message(self) -> str:
         if self.msg is not None:
             return self.msg
 
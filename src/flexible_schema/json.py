@@ -1,11 +1,12 @@
 """A simple class for flexible schema definition and usage."""
 
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any, ClassVar, TypedDict, TypeVar, get_args, get_origin
 
-from jsonschema import Draft202012Validator, validate
-from jsonschema.exceptions import SchemaError
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError, best_match
 
 from .base import Schema
 
@@ -202,15 +203,20 @@ class JSONSchema(Schema[JSONType, JSON_Schema_T, JSON_blob_T]):
             ValueError: Unsupported type: (<class 'int'>, <class 'str'>)
         """
 
+        if field_type is datetime:
+            return {"type": "string", "format": "date-time"}
+
+        json_type = cls.PYTHON_TO_JSON.get(field_type)
+        if json_type is not None:
+            return {"type": json_type}
+
         origin = get_origin(field_type)
 
         if origin is list:
             args = get_args(field_type)
             return {"type": "array", "items": cls.map_type(args[0])}
-        elif field_type is datetime or origin is datetime:
+        elif origin is datetime:
             return {"type": "string", "format": "date-time"}
-        elif field_type in cls.PYTHON_TO_JSON:
-            return {"type": cls.PYTHON_TO_JSON[field_type]}
         elif isinstance(field_type, str):
             return {"type": field_type}
         else:
@@ -250,31 +256,62 @@ class JSONSchema(Schema[JSONType, JSON_Schema_T, JSON_blob_T]):
             return list[cls._inv_map_type(json_type["items"])]
         elif json_type["type"] == "string" and json_type.get("format") == "date-time":
             return datetime
-        elif json_type["type"] in cls.PYTHON_TO_JSON.values():
-            return {v: k for k, v in cls.PYTHON_TO_JSON.items()}[json_type["type"]]
-        else:
+
+        py_type = cls._json_to_python().get(json_type["type"])
+        if py_type is None:
             raise ValueError(f"Unsupported type: {json_type}")
+        return py_type
 
     @classmethod
-    def schema(cls) -> dict[str, Any]:
-        schema_properties = {}
-        required_fields = []
+    def _json_to_python(cls) -> dict[str, Any]:
+        """Get the inverse of `PYTHON_TO_JSON`, which is cached and only re-built on changes.
 
-        for c in cls._columns():
-            schema_properties[c.name] = c.dtype
+        The cache is keyed on a copy of `PYTHON_TO_JSON`, so extending the mapping after first use is picked
+        up on the next call.
 
-            if c.is_required:
-                required_fields.append(c.name)
+        Examples:
+            >>> class Sample(JSONSchema):
+            ...     PYTHON_TO_JSON: ClassVar[dict[Any, str]] = {int: "integer"}
+            >>> Sample._json_to_python()
+            {'integer': <class 'int'>}
+            >>> Sample._json_to_python() is Sample._json_to_python()
+            True
+            >>> Sample.PYTHON_TO_JSON[str] = "string"
+            >>> Sample._json_to_python()
+            {'integer': <class 'int'>, 'string': <class 'str'>}
+        """
+        cached = cls.__dict__.get("__json_to_python_cache__")
+        if cached is None or cached[0] != cls.PYTHON_TO_JSON:
+            cached = (dict(cls.PYTHON_TO_JSON), {v: k for k, v in cls.PYTHON_TO_JSON.items()})
+            cls.__json_to_python_cache__ = cached
+        return cached[1]
 
-        schema = {
+    @classmethod
+    def schema(cls) -> dict[str, Any]:
+        """Get the JSON schema for this class.
+
+        The per-column JSON types and required names are resolved once at class creation, so this only
+        assembles them into a fresh dictionary (which callers are free to modify).
+
+        Examples:
+            >>> class Sample(JSONSchema):
+            ...     subject_id: int
+            ...     code: str | None = None
+            >>> Sample.schema() # doctest: +NORMALIZE_WHITESPACE
+            {'type': 'object',
+             'properties': {'subject_id': {'type': 'integer'}, 'code': {'type': 'string'}},
+             'required': ['subject_id'],
+             'additionalProperties': True}
+            >>> Sample.schema() is not Sample.schema()
+            True
+        """
+        return {
             "type": "object",
-            "properties": schema_properties,
-            "required": required_fields,
+            "properties": dict(cls.__col_dtypes__),
+            "required": list(cls.__required_names__),
             "additionalProperties": cls.allow_extra_columns,
         }
 
-        return schema
-
     @classmethod
     def _is_raw_table(cls, arg: Any) -> bool:
         """Check if the argument is a raw table (e.g., of type `RawTable_T`).
@@ -359,10 +396,37 @@ class JSONSchema(Schema[JSONType, JSON_Schema_T, JSON_blob_T]):
         """Get the type of a column in the schema."""
         return schema["properties"][col]
 
+    @classmethod
+    def _validator(cls) -> Draft202012Validator:
+        """Get a validator for this class's JSON schema, which is cached and only re-built on changes.
+
+        The only part of the JSON schema that can change after class definition is whether or not extra
+        properties are allowed, so the cache is keyed on that value.
+
+        Examples:
+            >>> class Sample(JSONSchema):
+            ...     subject_id: int
+            >>> Sample._validator() is Sample._validator()
+            True
+            >>> Sample.allow_extra_columns = False
+            >>> Sample._validator().schema["additionalProperties"]
+            False
+            >>> Sample.allow_extra_columns = True
+            >>> Sample._validator().schema["additionalProperties"]
+            True
+        """
+        cached = cls.__dict__.get("__validator_cache__")
+        if cached is None or cached[0] != cls.allow_extra_columns:
+            cached = (cls.allow_extra_columns, Draft202012Validator(cls.schema()))
+            cls.__validator_cache__ = cached
+        return cached[1]
+
     @classmethod
     def _validate_table(cls, table: JSON_blob_T):
         """Validate the table against the schema."""
-        validate(instance=table, schema=cls.schema())
+        error = best_match(cls._validator().iter_errors(table))
+        if error is not None:
+            raise error
 
     @classmethod
     def _raw_table_schema(cls, table: dict) -> Any:  # pragma: no cover
@@ -437,6 +501,14 @@ class JSONSchema(Schema[JSONType, JSON_Schema_T, JSON_blob_T]):
     def align(cls, table: JSON_blob_T) -> JSON_blob_T:
         raise NotImplementedError("JSONSchema does not support alignment")
 
+    @classmethod
+    def align_batch(cls, tables: Iterable[JSON_blob_T]) -> list[JSON_blob_T]:
+        raise NotImplementedError("JSONSchema does not support alignment")
+
+    @classmethod
+    def iter_align(cls, tables: Iterable[JSON_blob_T]) -> Iterator[JSON_blob_T]:
+        raise NotImplementedError("JSONSchema does not support alignment")
+
     @classmethod
     def _any_null(cls, table: JSON_blob_T, col: str) -> bool:
         """Checks if any value in the table at the given column is None.
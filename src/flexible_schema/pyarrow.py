@@ -1,5 +1,6 @@
 """A simple class for flexible schema definition and usage."""
 
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, ClassVar, get_args, get_origin
 
@@ -7,6 +8,7 @@ import pyarrow as pa
 import pyarrow.compute as pc
 
 from .base import Schema
+from .exceptions import TableValidationError
 
 
 # A Schema is a generic that takes a RawDataType_T, RawSchema_T, and a RawTable_T
@@ -225,7 +227,7 @@ class PyArrowSchema(Schema[pa.DataType | pa.Field, pa.Schema, pa.Table]):
         >>> ComplexNullsData.align("foo")
         Traceback (most recent call last):
             ...
-        TypeError: Expected a schema or table, but got: str
+        TypeError: Expected a table, but got: str
 
     You can also specify type hints directly using PyArrow types:
 
@@ -287,21 +289,152 @@ class PyArrowSchema(Schema[pa.DataType | pa.Field, pa.Schema, pa.Table]):
 
     @classmethod
     def map_type(cls, field_type: Any) -> pa.DataType:
-        origin = get_origin(field_type)
-
-        if origin is list:
-            args = get_args(field_type)
-            return pa.list_(cls.map_type(args[0]))
-        elif field_type in cls.PYTHON_TO_PYARROW:
-            return cls.PYTHON_TO_PYARROW[field_type]
+        pa_type = cls.PYTHON_TO_PYARROW.get(field_type)
+        if pa_type is not None:
+            return pa_type
         elif isinstance(field_type, pa.DataType):
             return field_type
+        elif get_origin(field_type) is list:
+            args = get_args(field_type)
+            return pa.list_(cls.map_type(args[0]))
         else:
             raise ValueError(f"Unsupported type: {field_type}")
 
     @classmethod
     def schema(cls) -> pa.Schema:
-        return pa.schema([(c.name, c.dtype) for c in cls._columns()])
+        """Get the PyArrow schema for this class, building it only on first use.
+
+        PyArrow schemas are immutable, so the same object can be safely returned on every call.
+
+        Examples:
+            >>> class Data(PyArrowSchema):
+            ...     subject_id: int
+            ...     code: str | None = None
+            >>> Data.schema()
+            subject_id: int64
+            code: string
+            >>> Data.schema() is Data.schema()
+            True
+        """
+        schema = cls.__dict__.get("__pa_schema__")
+        if schema is None:
+            schema = pa.schema(list(cls.__col_dtypes__.items()))
+            cls.__pa_schema__ = schema
+        return schema
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> pa.Table:
+        """Build an aligned table from row dictionaries.
+
+        Each column is converted to Arrow exactly once, directly to its schema type (extra columns have
+        their types inferred), rather than constructing one schema instance per row. Keys missing from a
+        given record are treated as nulls. With no records, the result is an empty table with just the
+        required columns, which is what alignment produces for records that lack every optional column.
+
+        Args:
+            records: The rows of the table, as dictionaries mapping column names to values. Any iterable
+                (e.g., a generator) is accepted; it is consumed once.
+
+        Returns:
+            The table, aligned to the schema.
+
+        Raises:
+            SchemaValidationError: If the records have missing required or disallowed extra columns.
+            TableValidationError: If the records' values can't be converted to the schema types or violate
+                the schema's nullability constraints.
+
+        Examples:
+            >>> class Data(PyArrowSchema):
+            ...     allow_extra_columns: ClassVar[bool] = True
+            ...     subject_id: int
+            ...     code: str
+            ...     numeric_value: float | None = None
+            >>> Data.from_records([
+            ...     {"code": "A", "subject_id": 1, "extra": True},
+            ...     {"code": "B", "subject_id": 2, "numeric_value": 3.5},
+            ... ])
+            pyarrow.Table
+            subject_id: int64
+            code: string
+            numeric_value: float
+            extra: bool
+            ----
+            subject_id: [[1,2]]
+            code: [["A","B"]]
+            numeric_value: [[null,3.5]]
+            extra: [[true,null]]
+            >>> Data.from_records([{"subject_id": 1}])
+            Traceback (most recent call last):
+                ...
+            flexible_schema.exceptions.SchemaValidationError: Missing required columns: code
+            >>> Data.from_records([{"subject_id": "foo", "code": "A"}])
+            Traceback (most recent call last):
+                ...
+            flexible_schema.exceptions.TableValidationError: Records could not be converted to a table
+            >>> Data.from_records([{"subject_id": 2**70, "code": "A"}])
+            Traceback (most recent call last):
+                ...
+            flexible_schema.exceptions.TableValidationError: Records could not be converted to a table
+
+        Records can come from any iterable, and an empty input gives a table that can be concatenated with
+        the output for records that lack the same optional columns:
+
+            >>> Data.from_records(r for r in [{"subject_id": 1, "code": "A"}])
+            pyarrow.Table
+            subject_id: int64
+            code: string
+            ----
+            subject_id: [[1]]
+            code: [["A"]]
+            >>> Data.from_records([])
+            pyarrow.Table
+            subject_id: int64
+            code: string
+            ----
+            subject_id: [[]]
+            code: [[]]
+            >>> pa.concat_tables(
+            ...     [Data.from_records([]), Data.from_records([{"subject_id": 1, "code": "A"}])]
+            ... ).num_rows
+            1
+        """
+        records = list(records)
+        if not records:
+            return cls.schema().empty_table().select(list(cls.__required_names__))
+
+        col_names = dict.fromkeys(k for r in records for k in r)
+        col_dtypes = cls.__col_dtypes__
+
+        try:
+            table = pa.table(
+                {c: pa.array([r.get(c) for r in records], type=col_dtypes.get(c)) for c in col_names}
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError) as e:
+            raise TableValidationError("Records could not be converted to a table") from e
+
+        return cls.align(table)
+
+    @classmethod
+    def _schema_report(
+        cls, schema: pa.Schema, raw_cols: list[str] | None = None
+    ) -> tuple[list[str], list[str], list[tuple[str, pa.DataType, pa.DataType]]]:
+        """Report how the schema deviates from the class schema, short-circuiting on an exact match.
+
+        A schema equal to the class's own schema (e.g., that of a table which has already been aligned) can't
+        deviate from it, so in that case a single `pa.Schema.equals` call replaces the per-column checks.
+
+        Examples:
+            >>> class Data(PyArrowSchema):
+            ...     subject_id: int
+            ...     code: str | None = None
+            >>> Data._schema_report(Data.schema())
+            ([], [], [])
+            >>> Data._schema_report(pa.schema([("subject_id", pa.int32())]))
+            ([], [], [('subject_id', DataType(int64), DataType(int32))])
+        """
+        if schema.equals(cls.schema()):
+            return [], [], []
+        return super()._schema_report(schema, raw_cols)
 
     @classmethod
     def _raw_schema_col_type(cls, schema: pa.Schema, col: str) -> pa.DataType:
@@ -327,6 +460,37 @@ class PyArrowSchema(Schema[pa.DataType | pa.Field, pa.Schema, pa.Table]):
     def _cast_raw_table_column(cls, table: pa.Table, col: str, want_type: pa.DataType) -> pa.Table:
         return table.set_column(table.schema.get_field_index(col), col, table.column(col).cast(want_type))
 
+    @classmethod
+    def _cast_raw_table(
+        cls, table: pa.Table, mistyped_cols: list[tuple[str, pa.DataType, pa.DataType]]
+    ) -> pa.Table:
+        """Cast all mistyped columns of the table in a single `pa.Table.cast` call.
+
+        Examples:
+            >>> class Data(PyArrowSchema):
+            ...     subject_id: pa.int64()
+            ...     code: pa.string()
+            ...     numeric_value: pa.float32()
+            >>> tbl = pa.table({
+            ...     "subject_id": pa.array([1, 2], type=pa.int32()),
+            ...     "code": ["A", "B"],
+            ...     "numeric_value": pa.array([1, 2], type=pa.int8()),
+            ... })
+            >>> Data._cast_raw_table(
+            ...     tbl,
+            ...     [("subject_id", pa.int64(), pa.int32()), ("numeric_value", pa.float32(), pa.int8())],
+            ... ).schema
+            subject_id: int64
+            code: string
+            numeric_value: float
+        """
+        want_types = {col: want_type for col, want_type, _ in mistyped_cols}
+        target_schema = pa.schema(
+            [f.with_type(want_types[f.name]) if f.name in want_types else f for f in table.schema],
+            metadata=table.schema.metadata,
+        )
+        return table.cast(target_schema)
+
     @classmethod
     def _any_null(cls, table: pa.Table, col: str) -> bool:
         """Check if any values in the column are null."""
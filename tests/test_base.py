@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
-from flexible_schema import Schema, SchemaValidationError, TableValidationError
+from flexible_schema import Required, Schema, SchemaValidationError, TableValidationError
 
 
 def get_sample_schema(allow_extra_columns: bool) -> Schema:
@@ -143,7 +143,7 @@ def test_more_errors():
             Sample.validate({"subject_id": 1, "foo": "bar"})
         assert "Schema validation failed" in str(excinfo.value)
 
-    with patch.object(Sample, "_validate_schema", side_effect=SchemaValidationError("No-details")):
+    with patch.object(Sample, "_schema_report", side_effect=SchemaValidationError("No-details")):
         with pytest.raises(SchemaValidationError) as excinfo:
             Sample.align({"subject_id": 1, "foo": "bar"})
         assert "No-details" in str(excinfo.value)
@@ -154,3 +154,138 @@ def test_more_errors():
         with pytest.raises(TableValidationError) as excinfo:
             Sample.validate({"subject_id": 1, "foo": "bar"})
         assert "Table validation failed" in str(excinfo.value)
+
+
+def test_column_groupings():
+    Sample = get_sample_schema(False)  # noqa: N806
+
+    assert Sample.required_columns() == ("subject_id",)
+    assert Sample.optional_columns() == ("foo",)
+    assert Sample.columns() == ("subject_id", "foo")
+
+    assert Sample._missing_req_cols({"foo"}) == ["subject_id"]
+    assert Sample._disallowed_extra_cols(["subject_id", "extra"]) == ["extra"]
+    assert Sample._mistyped_cols({"subject_id": str, "foo": str}, {"subject_id", "foo"}) == [
+        ("subject_id", int, str)
+    ]
+
+
+def test_align_batch():
+    Sample = get_sample_schema(True)  # noqa: N806
+
+    tables = [
+        {"foo": "a", "subject_id": 1},
+        {"foo": "b", "subject_id": 2},
+        {"subject_id": "3", "extra": 1},
+    ]
+
+    with patch.object(Sample, "_alignment_plan", wraps=Sample._alignment_plan) as plan:
+        aligned = Sample.align_batch(tables)
+    assert plan.call_count == 2
+
+    assert aligned == [
+        {"subject_id": 1, "foo": "a"},
+        {"subject_id": 2, "foo": "b"},
+        {"subject_id": 3, "extra": 1},
+    ]
+    assert [list(t) for t in aligned] == [
+        ["subject_id", "foo"],
+        ["subject_id", "foo"],
+        ["subject_id", "extra"],
+    ]
+    assert Sample.align(tables[0]) == aligned[0]
+
+    with patch.object(Sample, "_reorder_raw_table", wraps=Sample._reorder_raw_table) as reorder:
+        realigned = Sample.align_batch(aligned)
+    assert reorder.call_count == 0
+    assert all(a is b for a, b in zip(realigned, aligned, strict=True))
+
+    with pytest.raises(SchemaValidationError) as excinfo:
+        Sample.align_batch([tables[0], {"foo": "c"}])
+    assert "Missing required columns: subject_id" in str(excinfo.value)
+
+    with pytest.raises(TypeError) as excinfo:
+        Sample.align_batch([tables[0], "foo"])
+    assert "Expected a table, but got: str" in str(excinfo.value)
+
+
+def test_iter_align():
+    Sample = get_sample_schema(True)  # noqa: N806
+
+    consumed = []
+
+    def stream():
+        for i in range(3):
+            consumed.append(i)
+            yield {"foo": str(i), "subject_id": i}
+
+    aligned = Sample.iter_align(stream())
+    assert consumed == []
+
+    assert next(aligned) == {"subject_id": 0, "foo": "0"}
+    assert consumed == [0]
+
+    assert list(aligned) == [{"subject_id": 1, "foo": "1"}, {"subject_id": 2, "foo": "2"}]
+    assert consumed == [0, 1, 2]
+
+
+def test_field_override_and_extra_columns_flag():
+    Closed = get_sample_schema(False)  # noqa: N806
+
+    class Overridden(Closed):
+        foo: str | None = "X"
+
+    assert Overridden.foo == "X"
+    assert Overridden(subject_id=1).to_dict() == {"subject_id": 1, "foo": "X"}
+    assert Overridden(subject_id=1, foo="Y").to_dict() == {"subject_id": 1, "foo": "Y"}
+
+    Open = get_sample_schema(True)  # noqa: N806
+
+    class OpenOverridden(Open):
+        foo: str | None = "X"
+
+    sample = OpenOverridden(subject_id=1, foo="Y", extra=2)
+    assert sample.keys() == ["subject_id", "foo", "extra"]
+    assert list(sample) == ["subject_id", "foo", "extra"]
+
+    # The extra-columns flag can be changed after class creation.
+    with pytest.raises(SchemaValidationError):
+        Closed(subject_id=1, extra=2)
+    Closed.allow_extra_columns = True
+    assert Closed(subject_id=1, extra=2).to_dict() == {"subject_id": 1, "extra": 2}
+
+
+def test_instances_support_weakrefs_and_subclass_hooks():
+    import weakref
+
+    Sample = get_sample_schema(True)  # noqa: N806
+    sample = Sample(subject_id=1)
+    assert weakref.ref(sample)() is sample
+
+    calls = []
+
+    class Hooked(Sample):
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            calls.append(cls.__name__)
+
+    class Child(Hooked):
+        code: str | None = None
+
+    assert calls == ["Child"]
+    assert Child.code is None
+
+
+def test_align_checks_nullability_of_mistyped_tables():
+    Sample = get_sample_schema(True)  # noqa: N806
+
+    class Strict(Sample):
+        subject_id: Required(int, nullable=False)
+
+    # Nullability is validated before any casts, so a mistyped column with a disallowed null is rejected as a
+    # table error rather than being (attempted to be) cast.
+    with pytest.raises(TableValidationError) as excinfo:
+        Strict.align({"subject_id": None, "foo": "a"})
+    assert "Columns that should have no nulls but do: subject_id" in str(excinfo.value)
+
+    assert Strict.align({"foo": "a", "subject_id": "3"}) == {"subject_id": 3, "foo": "a"}